@@ -1,7 +1,9 @@
 from .credentials import (
     get_hf_turn_credentials,
     get_turn_credentials,
+    get_turn_credentials_async,
     get_twilio_turn_credentials,
+    invalidate_turn_credentials,
 )
 from .pause_detection import (
     ModelOptions,
@@ -55,6 +57,8 @@ __all__ = [
     "get_hf_turn_credentials",
     "get_twilio_turn_credentials",
     "get_turn_credentials",
+    "get_turn_credentials_async",
+    "invalidate_turn_credentials",
     "ReplyOnPause",
     "ReplyOnStopWords",
     "SileroVadOptions",
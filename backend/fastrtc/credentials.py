@@ -1,17 +1,66 @@
+import copy
 import os
+import threading
+import time
+from functools import partial
 from typing import Literal
 
+import anyio.to_thread
 import requests
+from requests.adapters import HTTPAdapter
+
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=3),
+)
+
+
+def get_session() -> requests.Session:
+    """Return the shared session used to fetch TURN credentials.
+
+    Reusing one session keeps connections to the credential servers alive
+    between calls. Mount extra adapters on it to customize retries.
+    """
+    return _session
+
+
+# Refresh cached credentials this many seconds before they actually expire
+_CACHE_MARGIN = 30
+_cred_cache: dict[tuple, tuple[float, dict]] = {}
+# Guards the two dicts only; never held while talking to a credential server
+_cred_cache_lock = threading.Lock()
+# One lock per credential identity so concurrent misses share a single fetch
+_cred_fetch_locks: dict[tuple, threading.Lock] = {}
+
+
+def invalidate_turn_credentials() -> None:
+    """Drop all cached TURN credentials so the next call fetches fresh ones."""
+    with _cred_cache_lock:
+        _cred_cache.clear()
+
+
+def _get_cached_credentials(key: tuple) -> dict | None:
+    with _cred_cache_lock:
+        cached = _cred_cache.get(key)
+    if cached is not None and time.time() < cached[0]:
+        # Callers may edit the config, so never hand out the cached object
+        return copy.deepcopy(cached[1])
+    return None
 
 
 def get_hf_turn_credentials(token=None):
+    token = (token or os.getenv("HF_TOKEN") or "").strip() or None
     if token is None:
-        token = os.getenv("HF_TOKEN")
-    credentials = requests.get(
+        raise ValueError(
+            "An HF token is required to get credentials from the HF turn server. "
+            "Pass `token` or set the HF_TOKEN environment variable."
+        )
+    credentials = _session.get(
         "https://fastrtc-turn-server-login.hf.space/credentials",
         headers={"X-HF-Access-Token": token},
     )
-    if not credentials.status_code == 200:
+    if not credentials.ok:
         raise ValueError("Failed to get credentials from HF turn server")
     return {
         "iceServers": [
@@ -33,14 +82,33 @@ def get_twilio_turn_credentials(twilio_sid=None, twilio_token=None):
         twilio_sid = os.environ.get("TWILIO_ACCOUNT_SID")
         twilio_token = os.environ.get("TWILIO_AUTH_TOKEN")
 
-    client = Client(twilio_sid, twilio_token)
+    key = ("twilio", twilio_sid, twilio_token)
+    credentials = _get_cached_credentials(key)
+    if credentials is not None:
+        return credentials
 
-    token = client.tokens.create()
+    with _cred_cache_lock:
+        fetch_lock = _cred_fetch_locks.setdefault(key, threading.Lock())
+    # Only callers missing this same key wait here, then reuse its result
+    with fetch_lock:
+        credentials = _get_cached_credentials(key)
+        if credentials is not None:
+            return credentials
 
-    return {
-        "iceServers": token.ice_servers,
-        "iceTransportPolicy": "relay",
-    }
+        client = Client(twilio_sid, twilio_token)
+
+        token = client.tokens.create()
+
+        credentials = {
+            "iceServers": token.ice_servers,
+            "iceTransportPolicy": "relay",
+        }
+        with _cred_cache_lock:
+            _cred_cache[key] = (
+                time.time() + int(token.ttl) - _CACHE_MARGIN,
+                credentials,
+            )
+    return copy.deepcopy(credentials)
 
 
 def get_turn_credentials(method: Literal["hf", "twilio"] = "hf", **kwargs):
@@ -50,3 +118,14 @@ def get_turn_credentials(method: Literal["hf", "twilio"] = "hf", **kwargs):
         return get_twilio_turn_credentials(**kwargs)
     else:
         raise ValueError("Invalid method. Must be 'hf' or 'twilio'")
+
+
+async def get_turn_credentials_async(method: Literal["hf", "twilio"] = "hf", **kwargs):
+    """Async version of `get_turn_credentials` for use inside an event loop.
+
+    The credential providers use blocking clients, so the fetch runs in a
+    worker thread instead of stalling the loop.
+    """
+    return await anyio.to_thread.run_sync(
+        partial(get_turn_credentials, method, **kwargs)
+    )
@@ -276,7 +276,8 @@ class SileroVADModel:
         logger.debug("VAD audio shape input: %s", audio_.shape)
         try:
             if audio_.dtype != np.float32:
-                audio_ = audio_.astype(np.float32) / 32768.0
+                audio_ = audio_.astype(np.float32)
+                audio_ /= 32768.0
             sr = 16000
             if sr != sampling_rate:
                 try:
@@ -3,6 +3,7 @@ import logging
 import re
 from typing import Callable, Literal
 
+import librosa
 import numpy as np
 
 from .reply_on_pause import (
@@ -56,18 +57,49 @@ class ReplyOnStopWords(ReplyOnPause):
             model=model,
         )
         self.stop_words = stop_words
+        self._compile_stop_words()
         self.state = ReplyOnStopWordsState()
         self.stt_model = get_stt_model("moonshine/base")
+        self._f32_scratch = np.empty(
+            int(self.algo_options.audio_chunk_duration * input_sample_rate * 1.5),
+            dtype=np.float32,
+        )
+
+    def _compile_stop_words(self):
+        split_stop_words = [
+            stop_word.lower().strip().split(" ") for stop_word in self.stop_words
+        ]
+        # Patterns are matched against the lowercased transcript
+        self.stop_word_patterns = [
+            re.compile(r"\b" + r"\s+".join(map(re.escape, words)) + r"[.,!?]*\b")
+            for words in split_stop_words
+        ]
+        # The first word must appear verbatim for the pattern to match, so a
+        # plain substring check can rule most transcripts out before the regex
+        self.stop_word_prefixes = [words[0] for words in split_stop_words]
+
+    def _audio_to_float32(self, audio: np.ndarray, sampling_rate: int) -> np.ndarray:
+        """Convert int16 audio to float32 in a reusable scratch buffer.
+
+        The result is only valid until the next call, so it must be consumed
+        (e.g. resampled into a new array) before then.
+        """
+        # librosa.resample returns its input unchanged at 16kHz, which would
+        # leave the scratch buffer aliased in the post stop word buffer
+        if audio.dtype != np.int16 or audio.ndim != 1 or sampling_rate == 16000:
+            return audio_to_float32((sampling_rate, audio))
+        if len(audio) > len(self._f32_scratch):
+            self._f32_scratch = np.empty(len(audio), dtype=np.float32)
+        out = self._f32_scratch[: len(audio)]
+        np.multiply(audio, np.float32(1 / 32768.0), out=out)
+        return out
 
     def stop_word_detected(self, text: str) -> bool:
-        for stop_word in self.stop_words:
-            stop_word = stop_word.lower().strip().split(" ")
-            if bool(
-                re.search(
-                    r"\b" + r"\s+".join(map(re.escape, stop_word)) + r"[.,!?]*\b",
-                    text.lower(),
-                )
-            ):
+        lowered = text.lower()
+        for stop_word, prefix, pattern in zip(
+            self.stop_words, self.stop_word_prefixes, self.stop_word_patterns
+        ):
+            if prefix in lowered and pattern.search(lowered):
                 logger.debug("Stop word detected: %s", stop_word)
                 return True
         return False
@@ -86,15 +118,18 @@ class ReplyOnStopWords(ReplyOnPause):
         self, audio: np.ndarray, sampling_rate: int, state: ReplyOnStopWordsState
     ) -> bool:
         """Take in the stream, determine if a pause happened"""
-        import librosa
-
         duration = len(audio) / sampling_rate
 
         if duration >= self.algo_options.audio_chunk_duration:
             if not state.stop_word_detected:
-                audio_f32 = audio_to_float32((sampling_rate, audio))
+                audio_f32 = self._audio_to_float32(audio, sampling_rate)
+                # Polyphase filtering (scipy.signal.resample_poly) is much cheaper
+                # than the default soxr_hq for integer ratios like 48k -> 16k
                 audio_rs = librosa.resample(
-                    audio_f32, orig_sr=sampling_rate, target_sr=16000
+                    audio_f32,
+                    orig_sr=sampling_rate,
+                    target_sr=16000,
+                    res_type="polyphase",
                 )
                 if state.post_stop_word_buffer is None:
                     state.post_stop_word_buffer = audio_rs
@@ -108,14 +143,16 @@ class ReplyOnStopWords(ReplyOnPause):
                     (16000, state.post_stop_word_buffer),
                     self.model_options,
                 )
-                text = stt_for_chunks(
-                    self.stt_model, (16000, state.post_stop_word_buffer), chunks
-                )
-                logger.debug(f"STT: {text}")
-                state.stop_word_detected = self.stop_word_detected(text)
-                if state.stop_word_detected:
-                    logger.debug("Stop word detected")
-                    self.send_stopword()
+                # No speech means no stop word, so skip the expensive STT pass
+                if chunks:
+                    text = stt_for_chunks(
+                        self.stt_model, (16000, state.post_stop_word_buffer), chunks
+                    )
+                    logger.debug(f"STT: {text}")
+                    state.stop_word_detected = self.stop_word_detected(text)
+                    if state.stop_word_detected:
+                        logger.debug("Stop word detected")
+                        self.send_stopword()
                 state.buffer = None
             else:
                 dur_vad, _ = self.model.vad((sampling_rate, audio), self.model_options)
@@ -0,0 +1,53 @@
+import re
+
+from fastrtc.reply_on_stopwords import ReplyOnStopWords
+
+
+def original_stop_word_detected(stop_words: list[str], text: str) -> bool:
+    for stop_word in stop_words:
+        stop_word = stop_word.lower().strip().split(" ")
+        if bool(
+            re.search(
+                r"\b" + r"\s+".join(map(re.escape, stop_word)) + r"[.,!?]*\b",
+                text.lower(),
+            )
+        ):
+            return True
+    return False
+
+
+def make_handler(stop_words: list[str]) -> ReplyOnStopWords:
+    # Skip __init__ so the VAD and STT models aren't loaded
+    handler = ReplyOnStopWords.__new__(ReplyOnStopWords)
+    handler.stop_words = stop_words
+    handler._compile_stop_words()
+    return handler
+
+
+def test_stop_word_detected_matches_original():
+    stop_words = ["Hey Computer", "over", "ok, go!", " stop "]
+    texts = [
+        "",
+        "hey computer",
+        "Hey   COMPUTER, what time is it?",
+        "hey, computer",
+        "heycomputer",
+        "Over.",
+        "that's all, over!?",
+        "moreover it works",
+        "the game is overtime",
+        "ok, go! now",
+        "ok go",
+        "please STOP.",
+        "unstoppable",
+        "nothing to see here",
+    ]
+    handler = make_handler(stop_words)
+    for text in texts:
+        assert handler.stop_word_detected(text) == original_stop_word_detected(
+            stop_words, text
+        ), text
+
+
+if __name__ == "__main__":
+    test_stop_word_detected_matches_original()
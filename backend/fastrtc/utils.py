@@ -310,7 +310,10 @@ def audio_to_float32(
     >>> audio_tuple = (sample_rate, audio_data)
     >>> audio_float32 = audio_to_float32(audio_tuple)
     """
-    return audio[1].astype(np.float32) / 32768.0
+    # astype always copies, so scale that copy in place rather than allocating again
+    audio_f32 = audio[1].astype(np.float32)
+    audio_f32 /= 32768.0
+    return audio_f32
 
 
 def audio_to_int16(
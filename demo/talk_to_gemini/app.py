@@ -1,5 +1,4 @@
 import asyncio
-import base64
 import json
 import os
 import pathlib
@@ -30,10 +29,37 @@ current_dir = pathlib.Path(__file__).parent
 
 load_dotenv()
 
+HTML_TEMPLATE = (current_dir / "index.html").read_text()
+# Serialized RTC config and the page rendered with it, reused until the config changes
+_cached_html: tuple[str, str] | None = None
+# Mic frames are batched into 100ms (at 16kHz) chunks before being sent
+INPUT_BATCH_SAMPLES = 1600
+
+# The client for the server's own GEMINI_API_KEY is shared across live sessions.
+# Keys pasted in by users get a client per connection so they aren't retained.
+_server_genai_client: genai.Client | None = None
+
+
+def get_genai_client(api_key: str | None) -> genai.Client:
+    global _server_genai_client
+    server_key = os.getenv("GEMINI_API_KEY")
+    if not server_key or api_key != server_key:
+        return genai.Client(api_key=api_key, http_options={"api_version": "v1alpha"})
+    if _server_genai_client is None:
+        _server_genai_client = genai.Client(
+            api_key=server_key,
+            http_options={"api_version": "v1alpha"},
+        )
+    return _server_genai_client
 
-def encode_audio(data: np.ndarray) -> str:
-    """Encode Audio data to send to the server"""
-    return base64.b64encode(data.tobytes()).decode("UTF-8")
+
+def put_latest(queue: asyncio.Queue, item) -> None:
+    """Enqueue item, evicting the oldest entry if the queue is full"""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(item)
 
 
 class GeminiHandler(AsyncStreamHandler):
@@ -51,7 +77,11 @@ class GeminiHandler(AsyncStreamHandler):
             output_frame_size,
             input_sample_rate=16000,
         )
-        self.input_queue: asyncio.Queue = asyncio.Queue()
+        # Bounded so a stalled Gemini session can't grow memory without limit;
+        # when full, the oldest mic audio is dropped since it is already stale
+        self.input_queue: asyncio.Queue = asyncio.Queue(maxsize=40)
+        self.input_batch: list[np.ndarray] = []
+        self.input_batch_samples = 0
         self.output_queue: asyncio.Queue = asyncio.Queue()
         self.quit: asyncio.Event = asyncio.Event()
 
@@ -69,10 +99,7 @@ class GeminiHandler(AsyncStreamHandler):
         else:
             api_key, voice_name = None, "Puck"
 
-        client = genai.Client(
-            api_key=api_key or os.getenv("GEMINI_API_KEY"),
-            http_options={"api_version": "v1alpha"},
-        )
+        client = get_genai_client(api_key or os.getenv("GEMINI_API_KEY"))
 
         config = LiveConnectConfig(
             response_modalities=["AUDIO"],  # type: ignore
@@ -104,9 +131,15 @@ class GeminiHandler(AsyncStreamHandler):
 
     async def receive(self, frame: tuple[int, np.ndarray]) -> None:
         _, array = frame
-        array = array.squeeze()
-        audio_message = encode_audio(array)
-        self.input_queue.put_nowait(audio_message)
+        if array.ndim > 1:
+            array = array.squeeze()
+        self.input_batch.append(array)
+        self.input_batch_samples += len(array)
+        if self.input_batch_samples >= INPUT_BATCH_SAMPLES:
+            # start_stream takes raw PCM bytes and does the wire encoding itself
+            put_latest(self.input_queue, np.concatenate(self.input_batch).tobytes())
+            self.input_batch = []
+            self.input_batch_samples = 0
 
     async def emit(self) -> tuple[int, np.ndarray] | None:
         return await wait_for_item(self.output_queue)
@@ -162,11 +195,20 @@ async def _(body: InputData):
 
 @app.get("/")
 async def index():
-    rtc_config = get_twilio_turn_credentials() if get_space() else None
-    html_content = (current_dir / "index.html").read_text()
-    html_content = html_content.replace("__RTC_CONFIGURATION__", json.dumps(rtc_config))
-    return HTMLResponse(content=html_content)
-
+    global _cached_html
+    # The Twilio client blocks, so fetch (or hit the credential cache) off the loop
+    rtc_config = (
+        await asyncio.to_thread(get_twilio_turn_credentials) if get_space() else None
+    )
+    # Re-render whenever the credentials refresh so a page never carries an
+    # expired TURN token
+    rtc_json = json.dumps(rtc_config)
+    if _cached_html is None or _cached_html[0] != rtc_json:
+        _cached_html = (
+            rtc_json,
+            HTML_TEMPLATE.replace("__RTC_CONFIGURATION__", rtc_json),
+        )
+    return HTMLResponse(content=_cached_html[1])
 
 if __name__ == "__main__":
     import os